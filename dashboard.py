@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+import io
+from PIL import Image
 from datetime import datetime
 
 # Set halaman
@@ -41,6 +43,68 @@ def load_data():
     
     return data
 
+# Dimensi strata untuk mode progresif, sama dengan dimensi filter di sidebar
+STRATA_COLUMNS = ['year', 'season_name', 'workingday_name']
+
+# Jumlah baris minimum per strata pada sampel, agar standard error tetap bisa dihitung
+MIN_STRATUM_SAMPLE = 5
+
+# Jumlah baris sampel minimum per kelompok agar error bar bisa diestimasi
+MIN_GROUP_SAMPLE = 2
+
+# Function untuk mengambil sampel bertingkat (stratified sample) dari seluruh data
+@st.cache_data
+def stratified_sample(sample_ratio):
+    shuffled = load_data().sample(frac=1, random_state=42)
+    strata = shuffled.groupby(STRATA_COLUMNS)
+    
+    # Setiap strata diambil sesuai rasio sampel, minimal MIN_STRATUM_SAMPLE baris
+    strata_size = strata['cnt'].transform('size')
+    sample_size = (strata_size * sample_ratio).round().clip(lower=MIN_STRATUM_SAMPLE, upper=strata_size)
+    keep = strata.cumcount() < sample_size
+    
+    # Bobot = ukuran strata / ukuran sampel strata, mengoreksi strata kecil yang terambil berlebih
+    sample = shuffled[keep].copy()
+    sample['weight'] = strata_size[keep] / sample_size[keep]
+    return sample.sort_index()
+
+# Function untuk menghitung variansi estimasi total dari nilai per baris sampel bertingkat
+def stratified_variance(sample, values):
+    strata = values.groupby([sample[column] for column in STRATA_COLUMNS])
+    n = strata.count()
+    N = sample.groupby(STRATA_COLUMNS)['weight'].sum()
+    return (N ** 2 * (1 - n / N) * strata.var().fillna(0) / n).sum()
+
+# Function untuk mengestimasi total dari sampel bertingkat beserta margin error 95%
+def estimate_total(sample, column):
+    estimate = (sample[column] * sample['weight']).sum()
+    return estimate, 1.96 * np.sqrt(stratified_variance(sample, sample[column]))
+
+# Function untuk mengestimasi rata-rata tertimbang per kelompok beserta margin error 95%
+def estimate_group_means(sample, by, columns):
+    rows = []
+    for key, group in sample.groupby(by):
+        key = key if isinstance(key, tuple) else (key,)
+        in_group = sample.index.isin(group.index)
+        group_weight = group['weight'].sum()
+        
+        row = dict(zip(by, key))
+        row['n'] = len(group)
+        for column in columns:
+            mean = (group[column] * group['weight']).sum() / group_weight
+            
+            # Linearisasi rata-rata rasio: kontribusi tiap baris sampel terhadap rata-rata kelompok
+            residual = pd.Series(np.where(in_group, (sample[column] - mean) / group_weight, 0), index=sample.index)
+            row[column] = mean
+            
+            # Dengan satu baris sampel residual selalu nol, sehingga error bar tidak bisa diestimasi
+            if len(group) < MIN_GROUP_SAMPLE:
+                row[f'{column}_err'] = np.nan
+            else:
+                row[f'{column}_err'] = 1.96 * np.sqrt(stratified_variance(sample, residual))
+        rows.append(row)
+    return pd.DataFrame(rows)
+
 # Load data
 df = load_data()
 
@@ -63,12 +127,30 @@ selected_season = st.sidebar.multiselect("Pilih Musim", season_options, default=
 day_type_options = df['workingday_name'].unique().tolist()
 selected_day_type = st.sidebar.multiselect("Pilih Tipe Hari", day_type_options, default=day_type_options)
 
+# Function untuk menerapkan filter sidebar pada data
+def apply_filters(data):
+    return data[
+        (data['year'].isin(selected_year)) &
+        (data['season_name'].isin(selected_season)) &
+        (data['workingday_name'].isin(selected_day_type))
+    ]
+
 # Terapkan filter
-filtered_df = df[
-    (df['year'].isin(selected_year)) &
-    (df['season_name'].isin(selected_season)) &
-    (df['workingday_name'].isin(selected_day_type))
-]
+filtered_df = apply_filters(df)
+
+# Mode progresif untuk data berukuran besar
+st.sidebar.header("Mode Progresif")
+progressive_mode = st.sidebar.checkbox(
+    "Tampilkan hasil perkiraan lebih dulu",
+    value=False,
+    help="Grafik dan metrik ditampilkan lebih dulu dari sampel bertingkat, lalu diperbarui otomatis setelah perhitungan lengkap selesai."
+)
+sample_ratio = st.sidebar.slider("Rasio Sampel (%)", min_value=1, max_value=50, value=10, disabled=not progressive_mode) / 100
+
+# Setiap strata diambil minimal MIN_STRATUM_SAMPLE baris, jadi ukuran sampel efektif bisa lebih besar dari rasio
+if progressive_mode:
+    effective_size = len(stratified_sample(sample_ratio))
+    st.sidebar.caption(f"Sampel efektif: {effective_size:,} dari {len(df):,} baris ({effective_size / len(df):.1%}), minimal {MIN_STRATUM_SAMPLE} baris per strata.")
 
 # Main dashboard
 st.title("🚲 Dashboard Analisis Penyewaan Sepeda")
@@ -80,550 +162,802 @@ st.markdown("""
 * **Pengguna Terdaftar (Registered)**: Pengguna yang telah mendaftar sebagai anggota layanan, cenderung menggunakan sepeda sebagai transportasi harian/rutin.
 """)
 
-# Metrics dengan presentasi perubahan
-col1, col2, col3 = st.columns(3)
-
 # Function untuk menghitung perubahan persentase
 def calculate_percentage_change(current, previous):
     if previous == 0:
         return 0
     return ((current - previous) / previous) * 100
 
-total_rentals = filtered_df['cnt'].sum()
-casual_rentals = filtered_df['casual'].sum()
-registered_rentals = filtered_df['registered'].sum()
+# Lebar maksimum gambar di Streamlit; gambar yang lebih lebar diperkecil oleh st.pyplot/st.image
+MAX_IMAGE_WIDTH = 1460
 
-with col1:
-    st.metric("Total Penyewaan", f"{total_rentals:,}")
+# Kelas untuk merekam tampilan analisis lalu menampilkannya sekaligus. Grafik langsung
+# diubah menjadi PNG saat direkam, sehingga penampilan ke halaman hanya butuh waktu singkat
+class DeferredPage:
+    def __init__(self):
+        self.calls = []
+        self.target = self.calls
+
+    def _record(self, name, *args, **kwargs):
+        self.target.append((name, args, kwargs, None))
+
+    def metric(self, *args, **kwargs):
+        self._record('metric', *args, **kwargs)
+
+    def header(self, *args, **kwargs):
+        self._record('header', *args, **kwargs)
+
+    def subheader(self, *args, **kwargs):
+        self._record('subheader', *args, **kwargs)
+
+    def info(self, *args, **kwargs):
+        self._record('info', *args, **kwargs)
+
+    def success(self, *args, **kwargs):
+        self._record('success', *args, **kwargs)
+
+    def pyplot(self, fig):
+        # Opsi yang sama dengan st.pyplot
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', bbox_inches='tight', dpi=200)
+        
+        # Perkecil di sini seperti st.pyplot, agar st.image tidak perlu memproses ulang saat ditampilkan
+        image = Image.open(buffer)
+        if image.width > MAX_IMAGE_WIDTH:
+            image = image.resize((MAX_IMAGE_WIDTH, int(image.height * MAX_IMAGE_WIDTH / image.width)), resample=Image.BILINEAR)
+        resized = io.BytesIO()
+        image.save(resized, format='PNG')
+        self._record('image', resized.getvalue(), use_column_width=True, output_format='PNG')
+
+    def columns(self, spec):
+        return self._blocks('columns', spec, spec)
+
+    def tabs(self, labels):
+        return self._blocks('tabs', labels, len(labels))
+
+    def _blocks(self, name, arg, count):
+        blocks = [DeferredBlock(self) for _ in range(count)]
+        self.target.append((name, (arg,), {}, blocks))
+        return blocks
+
+    # Tampilkan semua pemanggilan yang sudah direkam ke dalam container Streamlit
+    def show(self, container=st, calls=None):
+        for name, args, kwargs, blocks in self.calls if calls is None else calls:
+            if blocks is None:
+                getattr(container, name)(*args, **kwargs)
+            else:
+                for child, block in zip(getattr(container, name)(*args, **kwargs), blocks):
+                    self.show(child, block.calls)
+
+# Kelas untuk kolom atau tab yang direkam oleh DeferredPage
+class DeferredBlock:
+    def __init__(self, page):
+        self.page = page
+        self.calls = []
+
+    def __enter__(self):
+        self.parent = self.page.target
+        self.page.target = self.calls
+        return self
+
+    def __exit__(self, *exc):
+        self.page.target = self.parent
+
+# Fungsi untuk menampilkan metrik dan kelima tab analisis ke page (st, atau DeferredPage untuk ditampilkan nanti)
+def render_analysis(filtered_df, page=st):
+    # Metrics dengan presentasi perubahan
+    col1, col2, col3 = page.columns(3)
+
+    total_rentals = filtered_df['cnt'].sum()
+    casual_rentals = filtered_df['casual'].sum()
+    registered_rentals = filtered_df['registered'].sum()
+
+    with col1:
+        page.metric("Total Penyewaan", f"{total_rentals:,}")
     
-with col2:
-    st.metric("Pengguna Kasual", f"{casual_rentals:,}", 
-              f"{casual_rentals/total_rentals:.1%} dari total")
-    
-with col3:
-    st.metric("Pengguna Terdaftar", f"{registered_rentals:,}", 
-              f"{registered_rentals/total_rentals:.1%} dari total")
-
-# Tabs untuk navigasi
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["Tren Waktu", "Pola Hari Kerja vs Libur", "Analisis Musiman", "Pola Mingguan", "Pengaruh Cuaca"])
-
-with tab1:
-    st.header("Tren Penggunaan Sepeda Berdasarkan Waktu")
-    
-    # Visualisasi tren bulanan
-    monthly_trend = filtered_df.groupby(['year', 'month']).agg({
-        'cnt': 'mean',
-        'casual': 'mean',
-        'registered': 'mean'
-    }).reset_index()
-    
-    monthly_trend['period'] = monthly_trend['year'].astype(str) + '-' + monthly_trend['month'].astype(str).str.zfill(2)
-    
-    # Create plot
-    fig1, ax1 = plt.subplots(figsize=(12, 6))
-    
-    # Plot total, casual, and registered users
-    ax1.plot(monthly_trend['period'], monthly_trend['cnt'], marker='o', linewidth=2, label='Total')
-    ax1.plot(monthly_trend['period'], monthly_trend['casual'], marker='s', linewidth=2, label='Kasual')
-    ax1.plot(monthly_trend['period'], monthly_trend['registered'], marker='^', linewidth=2, label='Terdaftar')
-    
-    plt.xticks(rotation=45)
-    plt.title('Tren Rata-rata Penggunaan Sepeda per Bulan')
-    plt.xlabel('Periode (Tahun-Bulan)')
-    plt.ylabel('Rata-rata Penggunaan')
-    plt.legend()
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.tight_layout()
+    with col2:
+        page.metric("Pengguna Kasual", f"{casual_rentals:,}", 
+                  f"{casual_rentals/total_rentals:.1%} dari total")
     
-    st.pyplot(fig1)
+    with col3:
+        page.metric("Pengguna Terdaftar", f"{registered_rentals:,}", 
+                  f"{registered_rentals/total_rentals:.1%} dari total")
+
+    # Tabs untuk navigasi
+    tab1, tab2, tab3, tab4, tab5 = page.tabs(["Tren Waktu", "Pola Hari Kerja vs Libur", "Analisis Musiman", "Pola Mingguan", "Pengaruh Cuaca"])
+
+    with tab1:
+        page.header("Tren Penggunaan Sepeda Berdasarkan Waktu")
+    
+        # Visualisasi tren bulanan
+        monthly_trend = filtered_df.groupby(['year', 'month']).agg({
+            'cnt': 'mean',
+            'casual': 'mean',
+            'registered': 'mean'
+        }).reset_index()
+    
+        monthly_trend['period'] = monthly_trend['year'].astype(str) + '-' + monthly_trend['month'].astype(str).str.zfill(2)
+    
+        # Create plot
+        fig1, ax1 = plt.subplots(figsize=(12, 6))
+    
+        # Plot total, casual, and registered users
+        ax1.plot(monthly_trend['period'], monthly_trend['cnt'], marker='o', linewidth=2, label='Total')
+        ax1.plot(monthly_trend['period'], monthly_trend['casual'], marker='s', linewidth=2, label='Kasual')
+        ax1.plot(monthly_trend['period'], monthly_trend['registered'], marker='^', linewidth=2, label='Terdaftar')
+    
+        plt.xticks(rotation=45)
+        plt.title('Tren Rata-rata Penggunaan Sepeda per Bulan')
+        plt.xlabel('Periode (Tahun-Bulan)')
+        plt.ylabel('Rata-rata Penggunaan')
+        plt.legend()
+        plt.grid(True, linestyle='--', alpha=0.7)
+        plt.tight_layout()
     
-    # Generate insights based on filtered data
-    peak_period = monthly_trend.loc[monthly_trend['cnt'].idxmax()]
-    lowest_period = monthly_trend.loc[monthly_trend['cnt'].idxmin()]
+        page.pyplot(fig1)
+        plt.close(fig1)
     
-    # Insight berdasarkan data yang difilter
-    st.subheader("Insight Tren Waktu:")
+        # Generate insights based on filtered data
+        peak_period = monthly_trend.loc[monthly_trend['cnt'].idxmax()]
+        lowest_period = monthly_trend.loc[monthly_trend['cnt'].idxmin()]
     
-    col1, col2 = st.columns(2)
+        # Insight berdasarkan data yang difilter
+        page.subheader("Insight Tren Waktu:")
     
-    with col1:
-        st.info(f"""
-        **Periode Puncak Penggunaan:**
-        - Periode: {peak_period['period']}
-        - Rata-rata penyewaan: {peak_period['cnt']:.2f} per hari
-        - Pengguna kasual: {peak_period['casual']:.2f} per hari
-        - Pengguna terdaftar: {peak_period['registered']:.2f} per hari
-        """)
+        col1, col2 = page.columns(2)
     
-    with col2:
-        st.info(f"""
-        **Periode Terendah Penggunaan:**
-        - Periode: {lowest_period['period']}
-        - Rata-rata penyewaan: {lowest_period['cnt']:.2f} per hari
-        - Pengguna kasual: {lowest_period['casual']:.2f} per hari
-        - Pengguna terdaftar: {lowest_period['registered']:.2f} per hari
-        """)
+        with col1:
+            page.info(f"""
+            **Periode Puncak Penggunaan:**
+            - Periode: {peak_period['period']}
+            - Rata-rata penyewaan: {peak_period['cnt']:.2f} per hari
+            - Pengguna kasual: {peak_period['casual']:.2f} per hari
+            - Pengguna terdaftar: {peak_period['registered']:.2f} per hari
+            """)
     
-    # Tren dan pola yang terlihat
-    casual_trend = "meningkat" if monthly_trend['casual'].iloc[-1] > monthly_trend['casual'].iloc[0] else "menurun"
-    registered_trend = "meningkat" if monthly_trend['registered'].iloc[-1] > monthly_trend['registered'].iloc[0] else "menurun"
+        with col2:
+            page.info(f"""
+            **Periode Terendah Penggunaan:**
+            - Periode: {lowest_period['period']}
+            - Rata-rata penyewaan: {lowest_period['cnt']:.2f} per hari
+            - Pengguna kasual: {lowest_period['casual']:.2f} per hari
+            - Pengguna terdaftar: {lowest_period['registered']:.2f} per hari
+            """)
     
-    st.success(f"""
-    **Analisis Tren:**
-    - Tren pengguna kasual secara keseluruhan {casual_trend} sepanjang periode yang ditampilkan
-    - Tren pengguna terdaftar secara keseluruhan {registered_trend} sepanjang periode yang ditampilkan
-    - Terlihat pola musiman yang jelas dengan peningkatan penggunaan pada bulan-bulan hangat (musim panas dan gugur)
-    - Pengguna terdaftar konsisten memiliki angka lebih tinggi dibandingkan pengguna kasual
-    """)
+        # Tren dan pola yang terlihat
+        casual_trend = "meningkat" if monthly_trend['casual'].iloc[-1] > monthly_trend['casual'].iloc[0] else "menurun"
+        registered_trend = "meningkat" if monthly_trend['registered'].iloc[-1] > monthly_trend['registered'].iloc[0] else "menurun"
+    
+        page.success(f"""
+        **Analisis Tren:**
+        - Tren pengguna kasual secara keseluruhan {casual_trend} sepanjang periode yang ditampilkan
+        - Tren pengguna terdaftar secara keseluruhan {registered_trend} sepanjang periode yang ditampilkan
+        - Terlihat pola musiman yang jelas dengan peningkatan penggunaan pada bulan-bulan hangat (musim panas dan gugur)
+        - Pengguna terdaftar konsisten memiliki angka lebih tinggi dibandingkan pengguna kasual
+        """)
 
-with tab2:
-    st.header("Perbandingan Hari Kerja vs Hari Libur")
+    with tab2:
+        page.header("Perbandingan Hari Kerja vs Hari Libur")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = page.columns(2)
     
-    with col1:
-        # Berdasarkan workingday
-        workday_data = filtered_df.groupby('workingday_name')[['casual', 'registered', 'cnt']].mean().reset_index()
-        workday_melted = workday_data.melt(id_vars='workingday_name', value_vars=['casual', 'registered'], 
-                                      var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
-        
-        fig2, ax2 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='workingday_name', y='Rata-rata Pengguna', hue='Tipe Pengguna', data=workday_melted, palette='viridis', ax=ax2)
-        plt.title('Penggunaan Sepeda: Hari Kerja vs Weekend/Libur')
-        plt.xlabel('Tipe Hari')
-        plt.ylabel('Rata-rata Jumlah Pengguna')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        st.pyplot(fig2)
+        with col1:
+            # Berdasarkan workingday
+            workday_data = filtered_df.groupby('workingday_name')[['casual', 'registered', 'cnt']].mean().reset_index()
+            workday_melted = workday_data.melt(id_vars='workingday_name', value_vars=['casual', 'registered'], 
+                                          var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
+        
+            fig2, ax2 = plt.subplots(figsize=(10, 6))
+            sns.barplot(x='workingday_name', y='Rata-rata Pengguna', hue='Tipe Pengguna', data=workday_melted, palette='viridis', ax=ax2)
+            plt.title('Penggunaan Sepeda: Hari Kerja vs Weekend/Libur')
+            plt.xlabel('Tipe Hari')
+            plt.ylabel('Rata-rata Jumlah Pengguna')
+            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            plt.tight_layout()
+            page.pyplot(fig2)
+            plt.close(fig2)
         
-        # Insight berdasarkan data workday vs weekend - WITH ERROR HANDLING
-        workday_exists = 'Hari Kerja' in workday_data['workingday_name'].values
-        weekend_exists = 'Weekend/Libur' in workday_data['workingday_name'].values
+            # Insight berdasarkan data workday vs weekend - WITH ERROR HANDLING
+            workday_exists = 'Hari Kerja' in workday_data['workingday_name'].values
+            weekend_exists = 'Weekend/Libur' in workday_data['workingday_name'].values
         
-        if workday_exists and weekend_exists:
-            weekday_casual = workday_data[workday_data['workingday_name'] == 'Hari Kerja']['casual'].values[0]
-            weekend_casual = workday_data[workday_data['workingday_name'] == 'Weekend/Libur']['casual'].values[0]
-            weekday_registered = workday_data[workday_data['workingday_name'] == 'Hari Kerja']['registered'].values[0]
-            weekend_registered = workday_data[workday_data['workingday_name'] == 'Weekend/Libur']['registered'].values[0]
+            if workday_exists and weekend_exists:
+                weekday_casual = workday_data[workday_data['workingday_name'] == 'Hari Kerja']['casual'].values[0]
+                weekend_casual = workday_data[workday_data['workingday_name'] == 'Weekend/Libur']['casual'].values[0]
+                weekday_registered = workday_data[workday_data['workingday_name'] == 'Hari Kerja']['registered'].values[0]
+                weekend_registered = workday_data[workday_data['workingday_name'] == 'Weekend/Libur']['registered'].values[0]
             
-            casual_pct_change = ((weekend_casual - weekday_casual) / weekday_casual) * 100
-            registered_pct_change = ((weekend_registered - weekday_registered) / weekday_registered) * 100
+                casual_pct_change = ((weekend_casual - weekday_casual) / weekday_casual) * 100
+                registered_pct_change = ((weekend_registered - weekday_registered) / weekday_registered) * 100
             
-            st.info(f"""
-            **Insight Hari Kerja vs Weekend/Libur:**
+                page.info(f"""
+                **Insight Hari Kerja vs Weekend/Libur:**
             
-            - Pengguna kasual: {'meningkat' if casual_pct_change > 0 else 'menurun'} **{abs(casual_pct_change):.1f}%** pada akhir pekan dibanding hari kerja
-            - Pengguna terdaftar: {'meningkat' if registered_pct_change > 0 else 'menurun'} **{abs(registered_pct_change):.1f}%** pada akhir pekan dibanding hari kerja
-            """)
-        else:
-            st.info("""
-            **Insight Hari Kerja vs Weekend/Libur:**
+                - Pengguna kasual: {'meningkat' if casual_pct_change > 0 else 'menurun'} **{abs(casual_pct_change):.1f}%** pada akhir pekan dibanding hari kerja
+                - Pengguna terdaftar: {'meningkat' if registered_pct_change > 0 else 'menurun'} **{abs(registered_pct_change):.1f}%** pada akhir pekan dibanding hari kerja
+                """)
+            else:
+                page.info("""
+                **Insight Hari Kerja vs Weekend/Libur:**
             
-            Pilih kedua tipe hari (Hari Kerja dan Weekend/Libur) untuk melihat perbandingan.
-            """)
-    
-    with col2:
-        # Berdasarkan holiday
-        holiday_data = filtered_df.groupby('holiday_name')[['casual', 'registered', 'cnt']].mean().reset_index()
-        holiday_melted = holiday_data.melt(id_vars='holiday_name', value_vars=['casual', 'registered'], 
-                                      var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
-        
-        fig3, ax3 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='holiday_name', y='Rata-rata Pengguna', hue='Tipe Pengguna', data=holiday_melted, palette='magma', ax=ax3)
-        plt.title('Penggunaan Sepeda: Hari Kerja vs Hari Libur Nasional')
-        plt.xlabel('Tipe Hari')
-        plt.ylabel('Rata-rata Jumlah Pengguna')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        st.pyplot(fig3)
+                Pilih kedua tipe hari (Hari Kerja dan Weekend/Libur) untuk melihat perbandingan.
+                """)
+    
+        with col2:
+            # Berdasarkan holiday
+            holiday_data = filtered_df.groupby('holiday_name')[['casual', 'registered', 'cnt']].mean().reset_index()
+            holiday_melted = holiday_data.melt(id_vars='holiday_name', value_vars=['casual', 'registered'], 
+                                          var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
+        
+            fig3, ax3 = plt.subplots(figsize=(10, 6))
+            sns.barplot(x='holiday_name', y='Rata-rata Pengguna', hue='Tipe Pengguna', data=holiday_melted, palette='magma', ax=ax3)
+            plt.title('Penggunaan Sepeda: Hari Kerja vs Hari Libur Nasional')
+            plt.xlabel('Tipe Hari')
+            plt.ylabel('Rata-rata Jumlah Pengguna')
+            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            plt.tight_layout()
+            page.pyplot(fig3)
+            plt.close(fig3)
         
-        # Insight berdasarkan data holiday - WITH ERROR HANDLING
-        workday_exists = 'Hari Kerja' in holiday_data['holiday_name'].values
-        holiday_exists = 'Hari Libur' in holiday_data['holiday_name'].values
+            # Insight berdasarkan data holiday - WITH ERROR HANDLING
+            workday_exists = 'Hari Kerja' in holiday_data['holiday_name'].values
+            holiday_exists = 'Hari Libur' in holiday_data['holiday_name'].values
         
-        if workday_exists and holiday_exists:
-            workday_casual = holiday_data[holiday_data['holiday_name'] == 'Hari Kerja']['casual'].values[0]
-            holiday_casual = holiday_data[holiday_data['holiday_name'] == 'Hari Libur']['casual'].values[0]
-            workday_registered = holiday_data[holiday_data['holiday_name'] == 'Hari Kerja']['registered'].values[0]
-            holiday_registered = holiday_data[holiday_data['holiday_name'] == 'Hari Libur']['registered'].values[0]
+            if workday_exists and holiday_exists:
+                workday_casual = holiday_data[holiday_data['holiday_name'] == 'Hari Kerja']['casual'].values[0]
+                holiday_casual = holiday_data[holiday_data['holiday_name'] == 'Hari Libur']['casual'].values[0]
+                workday_registered = holiday_data[holiday_data['holiday_name'] == 'Hari Kerja']['registered'].values[0]
+                holiday_registered = holiday_data[holiday_data['holiday_name'] == 'Hari Libur']['registered'].values[0]
             
-            casual_hol_change = ((holiday_casual - workday_casual) / workday_casual) * 100 if workday_casual > 0 else 0
-            registered_hol_change = ((holiday_registered - workday_registered) / workday_registered) * 100 if workday_registered > 0 else 0
+                casual_hol_change = ((holiday_casual - workday_casual) / workday_casual) * 100 if workday_casual > 0 else 0
+                registered_hol_change = ((holiday_registered - workday_registered) / workday_registered) * 100 if workday_registered > 0 else 0
             
-            st.info(f"""
-            **Insight Hari Kerja vs Hari Libur Nasional:**
+                page.info(f"""
+                **Insight Hari Kerja vs Hari Libur Nasional:**
             
-            - Pengguna kasual: {'meningkat' if casual_hol_change > 0 else 'menurun'} **{abs(casual_hol_change):.1f}%** pada hari libur nasional dibanding hari kerja biasa
-            - Pengguna terdaftar: {'meningkat' if registered_hol_change > 0 else 'menurun'} **{abs(registered_hol_change):.1f}%** pada hari libur nasional dibanding hari kerja biasa
-            """)
-        else:
-            st.info("""
-            **Insight Hari Kerja vs Hari Libur Nasional:**
+                - Pengguna kasual: {'meningkat' if casual_hol_change > 0 else 'menurun'} **{abs(casual_hol_change):.1f}%** pada hari libur nasional dibanding hari kerja biasa
+                - Pengguna terdaftar: {'meningkat' if registered_hol_change > 0 else 'menurun'} **{abs(registered_hol_change):.1f}%** pada hari libur nasional dibanding hari kerja biasa
+                """)
+            else:
+                page.info("""
+                **Insight Hari Kerja vs Hari Libur Nasional:**
             
-            Pilih kedua tipe hari (Hari Kerja dan Hari Libur) untuk melihat perbandingan.
-            """)
+                Pilih kedua tipe hari (Hari Kerja dan Hari Libur) untuk melihat perbandingan.
+                """)
     
-    # Kesimpulan kombinasi dari kedua grafik
-    if len(workday_data) > 1 and len(holiday_data) > 1:  # Only show if we have enough data for comparison
-        st.success("""
-        **Analisis Pola Hari Kerja vs Libur:**
+        # Kesimpulan kombinasi dari kedua grafik
+        if len(workday_data) > 1 and len(holiday_data) > 1:  # Only show if we have enough data for comparison
+            page.success("""
+            **Analisis Pola Hari Kerja vs Libur:**
         
-        - Pengguna kasual menunjukkan preferensi yang kuat untuk menggunakan layanan pada akhir pekan dan hari libur
-        - Pengguna terdaftar lebih konsisten menggunakan layanan pada hari kerja
-        - Pola ini mengindikasikan bahwa pengguna terdaftar cenderung menggunakan sepeda sebagai transportasi harian untuk pergi ke tempat kerja atau aktivitas rutin
-        - Sementara pengguna kasual lebih cenderung menggunakan layanan untuk rekreasi atau aktivitas sosial pada saat libur
-        """)
-    else:
-        st.success("""
-        **Analisis Pola Hari Kerja vs Libur:**
+            - Pengguna kasual menunjukkan preferensi yang kuat untuk menggunakan layanan pada akhir pekan dan hari libur
+            - Pengguna terdaftar lebih konsisten menggunakan layanan pada hari kerja
+            - Pola ini mengindikasikan bahwa pengguna terdaftar cenderung menggunakan sepeda sebagai transportasi harian untuk pergi ke tempat kerja atau aktivitas rutin
+            - Sementara pengguna kasual lebih cenderung menggunakan layanan untuk rekreasi atau aktivitas sosial pada saat libur
+            """)
+        else:
+            page.success("""
+            **Analisis Pola Hari Kerja vs Libur:**
         
-        Pilih semua tipe hari untuk melihat analisis lengkap perbandingan pola penggunaan sepeda antara hari kerja dan hari libur.
-        """)
+            Pilih semua tipe hari untuk melihat analisis lengkap perbandingan pola penggunaan sepeda antara hari kerja dan hari libur.
+            """)
 
-with tab3:
-    st.header("Pengaruh Musim Terhadap Penggunaan Sepeda")
-    
-    # Analisis musiman
-    season_data = filtered_df.groupby('season_name').agg({
-        'cnt': 'mean',
-        'casual': 'mean',
-        'registered': 'mean'
-    }).reset_index()
-    
-    # Urutkan musim secara kronologis
-    season_order = ['Musim Semi', 'Musim Panas', 'Musim Gugur', 'Musim Dingin']
-    season_data['season_order'] = season_data['season_name'].apply(lambda x: season_order.index(x))
-    season_data = season_data.sort_values('season_order')
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Total penggunaan berdasarkan musim
-        fig4, ax4 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='season_name', y='cnt', data=season_data, palette='coolwarm', order=season_order, ax=ax4)
-        plt.title('Rata-rata Penggunaan Sepeda Berdasarkan Musim')
-        plt.xlabel('Musim')
-        plt.ylabel('Rata-rata Jumlah Penyewaan per Hari')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        st.pyplot(fig4)
+    with tab3:
+        page.header("Pengaruh Musim Terhadap Penggunaan Sepeda")
+    
+        # Analisis musiman
+        season_data = filtered_df.groupby('season_name').agg({
+            'cnt': 'mean',
+            'casual': 'mean',
+            'registered': 'mean'
+        }).reset_index()
+    
+        # Urutkan musim secara kronologis
+        season_order = ['Musim Semi', 'Musim Panas', 'Musim Gugur', 'Musim Dingin']
+        season_data['season_order'] = season_data['season_name'].apply(lambda x: season_order.index(x))
+        season_data = season_data.sort_values('season_order')
+    
+        col1, col2 = page.columns(2)
+    
+        with col1:
+            # Total penggunaan berdasarkan musim
+            fig4, ax4 = plt.subplots(figsize=(10, 6))
+            sns.barplot(x='season_name', y='cnt', data=season_data, palette='coolwarm', order=season_order, ax=ax4)
+            plt.title('Rata-rata Penggunaan Sepeda Berdasarkan Musim')
+            plt.xlabel('Musim')
+            plt.ylabel('Rata-rata Jumlah Penyewaan per Hari')
+            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            plt.tight_layout()
+            page.pyplot(fig4)
+            plt.close(fig4)
         
-        # Insight tentang total penyewaan per musim
-        best_season = season_data.loc[season_data['cnt'].idxmax()]
-        worst_season = season_data.loc[season_data['cnt'].idxmin()]
+            # Insight tentang total penyewaan per musim
+            best_season = season_data.loc[season_data['cnt'].idxmax()]
+            worst_season = season_data.loc[season_data['cnt'].idxmin()]
         
-        st.info(f"""
-        **Insight Penyewaan Total per Musim:**
+            page.info(f"""
+            **Insight Penyewaan Total per Musim:**
         
-        - Musim dengan penyewaan tertinggi: **{best_season['season_name']}** ({best_season['cnt']:.2f} penyewaan/hari)
-        - Musim dengan penyewaan terendah: **{worst_season['season_name']}** ({worst_season['cnt']:.2f} penyewaan/hari)
-        - Perbedaan: {((best_season['cnt'] - worst_season['cnt']) / worst_season['cnt'] * 100):.1f}% lebih tinggi
-        """)
+            - Musim dengan penyewaan tertinggi: **{best_season['season_name']}** ({best_season['cnt']:.2f} penyewaan/hari)
+            - Musim dengan penyewaan terendah: **{worst_season['season_name']}** ({worst_season['cnt']:.2f} penyewaan/hari)
+            - Perbedaan: {((best_season['cnt'] - worst_season['cnt']) / worst_season['cnt'] * 100):.1f}% lebih tinggi
+            """)
     
-    with col2:
-        # Perbandingan tipe pengguna berdasarkan musim
-        season_melted = season_data.melt(id_vars=['season_name', 'season_order'], 
-                                    value_vars=['casual', 'registered'],
-                                    var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
-        
-        fig5, ax5 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='season_name', y='Rata-rata Pengguna', hue='Tipe Pengguna', 
-                   data=season_melted, palette='viridis', order=season_order, ax=ax5)
-        plt.title('Perbandingan Tipe Pengguna Berdasarkan Musim')
-        plt.xlabel('Musim')
-        plt.ylabel('Rata-rata Jumlah Pengguna per Hari')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        st.pyplot(fig5)
+        with col2:
+            # Perbandingan tipe pengguna berdasarkan musim
+            season_melted = season_data.melt(id_vars=['season_name', 'season_order'], 
+                                        value_vars=['casual', 'registered'],
+                                        var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
         
-        # Insight tentang tipe pengguna per musim
-        casual_best = season_data.loc[season_data['casual'].idxmax()]
-        casual_worst = season_data.loc[season_data['casual'].idxmin()]
-        registered_best = season_data.loc[season_data['registered'].idxmax()]
-        registered_worst = season_data.loc[season_data['registered'].idxmin()]
+            fig5, ax5 = plt.subplots(figsize=(10, 6))
+            sns.barplot(x='season_name', y='Rata-rata Pengguna', hue='Tipe Pengguna', 
+                       data=season_melted, palette='viridis', order=season_order, ax=ax5)
+            plt.title('Perbandingan Tipe Pengguna Berdasarkan Musim')
+            plt.xlabel('Musim')
+            plt.ylabel('Rata-rata Jumlah Pengguna per Hari')
+            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            plt.tight_layout()
+            page.pyplot(fig5)
+            plt.close(fig5)
         
-        st.info(f"""
-        **Insight Tipe Pengguna per Musim:**
+            # Insight tentang tipe pengguna per musim
+            casual_best = season_data.loc[season_data['casual'].idxmax()]
+            casual_worst = season_data.loc[season_data['casual'].idxmin()]
+            registered_best = season_data.loc[season_data['registered'].idxmax()]
+            registered_worst = season_data.loc[season_data['registered'].idxmin()]
         
-        - Pengguna kasual:
-          * Tertinggi di **{casual_best['season_name']}** ({casual_best['casual']:.2f}/hari)
-          * Terendah di **{casual_worst['season_name']}** ({casual_worst['casual']:.2f}/hari)
+            page.info(f"""
+            **Insight Tipe Pengguna per Musim:**
         
-        - Pengguna terdaftar:
-          * Tertinggi di **{registered_best['season_name']}** ({registered_best['registered']:.2f}/hari)
-          * Terendah di **{registered_worst['season_name']}** ({registered_worst['registered']:.2f}/hari)
-        """)
+            - Pengguna kasual:
+              * Tertinggi di **{casual_best['season_name']}** ({casual_best['casual']:.2f}/hari)
+              * Terendah di **{casual_worst['season_name']}** ({casual_worst['casual']:.2f}/hari)
+        
+            - Pengguna terdaftar:
+              * Tertinggi di **{registered_best['season_name']}** ({registered_best['registered']:.2f}/hari)
+              * Terendah di **{registered_worst['season_name']}** ({registered_worst['registered']:.2f}/hari)
+            """)
     
-    # Analisis tren musiman
-    seasonal_ratio = season_data.copy()
-    seasonal_ratio['casual_pct'] = seasonal_ratio['casual'] / seasonal_ratio['cnt'] * 100
-    seasonal_ratio['registered_pct'] = seasonal_ratio['registered'] / seasonal_ratio['cnt'] * 100
+        # Analisis tren musiman
+        seasonal_ratio = season_data.copy()
+        seasonal_ratio['casual_pct'] = seasonal_ratio['casual'] / seasonal_ratio['cnt'] * 100
+        seasonal_ratio['registered_pct'] = seasonal_ratio['registered'] / seasonal_ratio['cnt'] * 100
     
-    st.subheader("Proporsi Pengguna per Musim")
+        page.subheader("Proporsi Pengguna per Musim")
     
-    # Membuat stacked bar chart proporsi
-    fig6, ax6 = plt.subplots(figsize=(10, 6))
+        # Membuat stacked bar chart proporsi
+        fig6, ax6 = plt.subplots(figsize=(10, 6))
     
-    seasonal_ratio['casual_pct'] = seasonal_ratio['casual'] / seasonal_ratio['cnt'] * 100
-    seasonal_ratio['registered_pct'] = seasonal_ratio['registered'] / seasonal_ratio['cnt'] * 100
+        seasonal_ratio['casual_pct'] = seasonal_ratio['casual'] / seasonal_ratio['cnt'] * 100
+        seasonal_ratio['registered_pct'] = seasonal_ratio['registered'] / seasonal_ratio['cnt'] * 100
     
-    x = np.arange(len(seasonal_ratio))
-    width = 0.5
+        x = np.arange(len(seasonal_ratio))
+        width = 0.5
     
-    ax6.bar(x, seasonal_ratio['registered_pct'], width, label='Terdaftar', color='#5cb85c')
-    ax6.bar(x, seasonal_ratio['casual_pct'], width, bottom=seasonal_ratio['registered_pct'], label='Kasual', color='#f0ad4e')
+        ax6.bar(x, seasonal_ratio['registered_pct'], width, label='Terdaftar', color='#5cb85c')
+        ax6.bar(x, seasonal_ratio['casual_pct'], width, bottom=seasonal_ratio['registered_pct'], label='Kasual', color='#f0ad4e')
     
-    ax6.set_title('Proporsi Pengguna Kasual vs Terdaftar per Musim')
-    ax6.set_xlabel('Musim')
-    ax6.set_ylabel('Persentase (%)')
-    ax6.set_xticks(x)
-    ax6.set_xticklabels(seasonal_ratio['season_name'])
-    ax6.legend()
-    ax6.grid(axis='y', linestyle='--', alpha=0.7)
+        ax6.set_title('Proporsi Pengguna Kasual vs Terdaftar per Musim')
+        ax6.set_xlabel('Musim')
+        ax6.set_ylabel('Persentase (%)')
+        ax6.set_xticks(x)
+        ax6.set_xticklabels(seasonal_ratio['season_name'])
+        ax6.legend()
+        ax6.grid(axis='y', linestyle='--', alpha=0.7)
     
-    for i, v in enumerate(seasonal_ratio['registered_pct']):
-        ax6.text(i, v/2, f"{v:.1f}%", ha='center', color='white', fontweight='bold')
+        for i, v in enumerate(seasonal_ratio['registered_pct']):
+            ax6.text(i, v/2, f"{v:.1f}%", ha='center', color='white', fontweight='bold')
         
-    for i, v in enumerate(seasonal_ratio['casual_pct']):
-        ax6.text(i, seasonal_ratio['registered_pct'].iloc[i] + v/2, f"{v:.1f}%", ha='center', color='white', fontweight='bold')
+        for i, v in enumerate(seasonal_ratio['casual_pct']):
+            ax6.text(i, seasonal_ratio['registered_pct'].iloc[i] + v/2, f"{v:.1f}%", ha='center', color='white', fontweight='bold')
     
-    plt.tight_layout()
-    st.pyplot(fig6)
+        plt.tight_layout()
+        page.pyplot(fig6)
+        plt.close(fig6)
     
-    # Kesimpulan keseluruhan analisis musiman
-    highest_casual_pct_season = seasonal_ratio.loc[seasonal_ratio['casual_pct'].idxmax()]['season_name']
+        # Kesimpulan keseluruhan analisis musiman
+        highest_casual_pct_season = seasonal_ratio.loc[seasonal_ratio['casual_pct'].idxmax()]['season_name']
     
-    st.success(f"""
-    **Analisis Musiman:**
+        page.success(f"""
+        **Analisis Musiman:**
     
-    - Musim panas dan musim gugur menunjukkan jumlah penyewaan tertinggi, sementara musim semi konsisten menjadi musim dengan penyewaan terendah
-    - Proporsi pengguna kasual tertinggi terjadi pada **{highest_casual_pct_season}**, menunjukkan peningkatan aktivitas rekreasi pada musim tersebut
-    - Pengguna terdaftar menunjukkan pola yang lebih konsisten sepanjang tahun dibandingkan pengguna kasual yang lebih terpengaruh faktor musiman
-    - Suhu dan kondisi cuaca yang lebih baik pada musim panas dan gugur tampaknya menjadi faktor utama yang mendorong peningkatan penyewaan
-    """)
+        - Musim panas dan musim gugur menunjukkan jumlah penyewaan tertinggi, sementara musim semi konsisten menjadi musim dengan penyewaan terendah
+        - Proporsi pengguna kasual tertinggi terjadi pada **{highest_casual_pct_season}**, menunjukkan peningkatan aktivitas rekreasi pada musim tersebut
+        - Pengguna terdaftar menunjukkan pola yang lebih konsisten sepanjang tahun dibandingkan pengguna kasual yang lebih terpengaruh faktor musiman
+        - Suhu dan kondisi cuaca yang lebih baik pada musim panas dan gugur tampaknya menjadi faktor utama yang mendorong peningkatan penyewaan
+        """)
 
-with tab4:
-    st.header("Pola Penggunaan Mingguan")
+    with tab4:
+        page.header("Pola Penggunaan Mingguan")
+    
+        # Persiapan data hari dalam seminggu
+        weekday_data = filtered_df.groupby('day_name')[['cnt', 'casual', 'registered']].mean().reset_index()
+        weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        weekday_data['day_order'] = weekday_data['day_name'].apply(lambda x: weekday_order.index(x))
+        weekday_data = weekday_data.sort_values('day_order')
+    
+        # Mengubah nama hari ke Bahasa Indonesia untuk display
+        day_name_id = {
+            'Monday': 'Senin', 'Tuesday': 'Selasa', 'Wednesday': 'Rabu', 
+            'Thursday': 'Kamis', 'Friday': 'Jumat', 'Saturday': 'Sabtu', 'Sunday': 'Minggu'
+        }
+        weekday_data['day_name_id'] = weekday_data['day_name'].map(day_name_id)
+    
+        col1, col2 = page.columns(2)
+    
+        with col1:
+            # Pola mingguan total
+            fig7, ax7 = plt.subplots(figsize=(10, 6))
+            sns.lineplot(x='day_name_id', y='cnt', data=weekday_data, marker='o', linewidth=2, ax=ax7)
+            plt.title('Pola Penggunaan Sepeda Sepanjang Minggu')
+            plt.xlabel('Hari')
+            plt.ylabel('Rata-rata Jumlah Penyewaan')
+            plt.grid(True, linestyle='--', alpha=0.7)
+            plt.tight_layout()
+            page.pyplot(fig7)
+            plt.close(fig7)
+        
+            # Insight tentang pola mingguan total
+            busiest_day = weekday_data.loc[weekday_data['cnt'].idxmax()]
+            slowest_day = weekday_data.loc[weekday_data['cnt'].idxmin()]
+        
+            page.info(f"""
+            **Insight Pola Mingguan Total:**
+        
+            - Hari tersibuk: **{busiest_day['day_name_id']}** dengan rata-rata {busiest_day['cnt']:.2f} penyewaan
+            - Hari terendah: **{slowest_day['day_name_id']}** dengan rata-rata {slowest_day['cnt']:.2f} penyewaan
+            - Akhir pekan (Sabtu-Minggu) menunjukkan pola penggunaan yang {'lebih tinggi' if weekday_data[weekday_data['day_name'].isin(['Saturday', 'Sunday'])]['cnt'].mean() > weekday_data[~weekday_data['day_name'].isin(['Saturday', 'Sunday'])]['cnt'].mean() else 'lebih rendah'} dibandingkan hari kerja
+            """)
+    
+        with col2:
+            # Distribusi tipe pengguna berdasarkan hari
+            weekday_melted = weekday_data.melt(id_vars=['day_name', 'day_name_id'], 
+                                          value_vars=['casual', 'registered'],
+                                          var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
+        
+            fig8, ax8 = plt.subplots(figsize=(10, 6))
+            sns.barplot(x='day_name_id', y='Rata-rata Pengguna', hue='Tipe Pengguna', data=weekday_melted, palette='magma', ax=ax8)
+            plt.title('Perbandingan Tipe Pengguna Berdasarkan Hari')
+            plt.xlabel('Hari')
+            plt.ylabel('Rata-rata Jumlah Pengguna')
+            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            plt.legend(title='Tipe Pengguna')
+            plt.tight_layout()
+            page.pyplot(fig8)
+            plt.close(fig8)
+        
+            # Insight tentang tipe pengguna per hari
+            casual_best_day = weekday_data.loc[weekday_data['casual'].idxmax()]
+            casual_worst_day = weekday_data.loc[weekday_data['casual'].idxmin()]
+            registered_best_day = weekday_data.loc[weekday_data['registered'].idxmax()]
+            registered_worst_day = weekday_data.loc[weekday_data['registered'].idxmin()]
+        
+            page.info(f"""
+            **Insight Tipe Pengguna per Hari:**
+        
+            - Pengguna kasual:
+              * Tertinggi pada **{casual_best_day['day_name_id']}** ({casual_best_day['casual']:.2f}/hari)
+              * Terendah pada **{casual_worst_day['day_name_id']}** ({casual_worst_day['casual']:.2f}/hari)
+        
+            - Pengguna terdaftar:
+              * Tertinggi pada **{registered_best_day['day_name_id']}** ({registered_best_day['registered']:.2f}/hari)
+              * Terendah pada **{registered_worst_day['day_name_id']}** ({registered_worst_day['registered']:.2f}/hari)
+            """)
     
-    # Persiapan data hari dalam seminggu
-    weekday_data = filtered_df.groupby('day_name')[['cnt', 'casual', 'registered']].mean().reset_index()
-    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    weekday_data['day_order'] = weekday_data['day_name'].apply(lambda x: weekday_order.index(x))
-    weekday_data = weekday_data.sort_values('day_order')
+        # Analisis komposisi pengguna per hari
+        weekday_ratio = weekday_data.copy()
+        weekday_ratio['casual_pct'] = weekday_ratio['casual'] / weekday_ratio['cnt'] * 100
+        weekday_ratio['registered_pct'] = weekday_ratio['registered'] / weekday_ratio['cnt'] * 100
     
-    # Mengubah nama hari ke Bahasa Indonesia untuk display
-    day_name_id = {
-        'Monday': 'Senin', 'Tuesday': 'Selasa', 'Wednesday': 'Rabu', 
-        'Thursday': 'Kamis', 'Friday': 'Jumat', 'Saturday': 'Sabtu', 'Sunday': 'Minggu'
-    }
-    weekday_data['day_name_id'] = weekday_data['day_name'].map(day_name_id)
+        # Plot line chart persentase per hari
+        fig9, ax9 = plt.subplots(figsize=(12, 6))
     
-    col1, col2 = st.columns(2)
+        ax9.plot(weekday_ratio['day_name_id'], weekday_ratio['casual_pct'], marker='o', linewidth=2, label='Pengguna Kasual (%)')
+        ax9.plot(weekday_ratio['day_name_id'], weekday_ratio['registered_pct'], marker='s', linewidth=2, label='Pengguna Terdaftar (%)')
+    
+        ax9.set_title('Persentase Tipe Pengguna per Hari')
+        ax9.set_xlabel('Hari')
+        ax9.set_ylabel('Persentase (%)')
+        ax9.set_ylim(0, 100)
+        ax9.legend()
+        ax9.grid(True, linestyle='--', alpha=0.7)
     
-    with col1:
-        # Pola mingguan total
-        fig7, ax7 = plt.subplots(figsize=(10, 6))
-        sns.lineplot(x='day_name_id', y='cnt', data=weekday_data, marker='o', linewidth=2, ax=ax7)
-        plt.title('Pola Penggunaan Sepeda Sepanjang Minggu')
-        plt.xlabel('Hari')
-        plt.ylabel('Rata-rata Jumlah Penyewaan')
-        plt.grid(True, linestyle='--', alpha=0.7)
         plt.tight_layout()
-        st.pyplot(fig7)
+        page.pyplot(fig9)
+        plt.close(fig9)
+    
+        # Kesimpulan keseluruhan pola mingguan
+        page.success("""
+        **Analisis Pola Mingguan:**
+    
+        - Terdapat perbedaan yang jelas antara pola penggunaan pada hari kerja dan akhir pekan
+        - Pengguna kasual menunjukkan peningkatan signifikan pada akhir pekan, mengindikasikan penggunaan untuk aktivitas rekreasi
+        - Pengguna terdaftar memiliki puncak penggunaan pada hari kerja, menunjukkan penggunaan sepeda sebagai transportasi komuter
+        - Persentase pengguna kasual tertinggi terjadi pada akhir pekan, sementara persentase pengguna terdaftar dominan pada hari kerja
+        """)
+
+    with tab5:
+        page.header("Pengaruh Cuaca Terhadap Penyewaan Sepeda")
+    
+        # Analisis berdasarkan cuaca
+        weather_analysis = filtered_df.groupby('weather_condition').agg({
+            'cnt': 'mean',
+            'casual': 'mean',
+            'registered': 'mean'
+        }).reset_index()
+    
+        # Urutkan kondisi cuaca dari yang terbaik ke terburuk
+        weather_order = ['Cerah', 'Berawan/Berkabut', 'Hujan Ringan', 'Hujan Lebat']
+        weather_analysis['weather_order'] = weather_analysis['weather_condition'].apply(lambda x: weather_order.index(x))
+        weather_analysis = weather_analysis.sort_values('weather_order')
+    
+        col1, col2 = page.columns(2)
+    
+        with col1:
+            # Total penggunaan berdasarkan cuaca
+            fig10, ax10 = plt.subplots(figsize=(10, 6))
+            sns.barplot(x='weather_condition', y='cnt', data=weather_analysis, palette='Blues_r', order=weather_order, ax=ax10)
+            plt.title('Rata-rata Penggunaan Sepeda Berdasarkan Kondisi Cuaca')
+            plt.xlabel('Kondisi Cuaca')
+            plt.ylabel('Rata-rata Jumlah Penyewaan')
+            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            plt.tight_layout()
+            page.pyplot(fig10)
+            plt.close(fig10)
         
-        # Insight tentang pola mingguan total
-        busiest_day = weekday_data.loc[weekday_data['cnt'].idxmax()]
-        slowest_day = weekday_data.loc[weekday_data['cnt'].idxmin()]
+            # Insight tentang penggunaan berdasarkan cuaca
+            best_weather = weather_analysis.loc[weather_analysis['cnt'].idxmax()]
+            worst_weather = weather_analysis.loc[weather_analysis['cnt'].idxmin()]
         
-        st.info(f"""
-        **Insight Pola Mingguan Total:**
+            weather_impact = ((best_weather['cnt'] - worst_weather['cnt']) / best_weather['cnt']) * 100
         
-        - Hari tersibuk: **{busiest_day['day_name_id']}** dengan rata-rata {busiest_day['cnt']:.2f} penyewaan
-        - Hari terendah: **{slowest_day['day_name_id']}** dengan rata-rata {slowest_day['cnt']:.2f} penyewaan
-        - Akhir pekan (Sabtu-Minggu) menunjukkan pola penggunaan yang {'lebih tinggi' if weekday_data[weekday_data['day_name'].isin(['Saturday', 'Sunday'])]['cnt'].mean() > weekday_data[~weekday_data['day_name'].isin(['Saturday', 'Sunday'])]['cnt'].mean() else 'lebih rendah'} dibandingkan hari kerja
-        """)
+            page.info(f"""
+            **Insight Pengaruh Cuaca Terhadap Total Penyewaan:**
+        
+            - Kondisi cuaca terbaik untuk penyewaan: **{best_weather['weather_condition']}** ({best_weather['cnt']:.2f} penyewaan/hari)
+            - Kondisi cuaca terburuk untuk penyewaan: **{worst_weather['weather_condition']}** ({worst_weather['cnt']:.2f} penyewaan/hari)
+            - Penurunan: {weather_impact:.1f}% dari kondisi terbaik ke terburuk
+            """)
     
-    with col2:
-        # Distribusi tipe pengguna berdasarkan hari
-        weekday_melted = weekday_data.melt(id_vars=['day_name', 'day_name_id'], 
-                                      value_vars=['casual', 'registered'],
-                                      var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
-        
-        fig8, ax8 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='day_name_id', y='Rata-rata Pengguna', hue='Tipe Pengguna', data=weekday_melted, palette='magma', ax=ax8)
-        plt.title('Perbandingan Tipe Pengguna Berdasarkan Hari')
-        plt.xlabel('Hari')
-        plt.ylabel('Rata-rata Jumlah Pengguna')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.legend(title='Tipe Pengguna')
-        plt.tight_layout()
-        st.pyplot(fig8)
+        with col2:
+            # Perbandingan tipe pengguna berdasarkan cuaca
+            weather_melted = weather_analysis.melt(id_vars=['weather_condition', 'weather_order'], 
+                                             value_vars=['casual', 'registered'],
+                                             var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
         
-        # Insight tentang tipe pengguna per hari
-        casual_best_day = weekday_data.loc[weekday_data['casual'].idxmax()]
-        casual_worst_day = weekday_data.loc[weekday_data['casual'].idxmin()]
-        registered_best_day = weekday_data.loc[weekday_data['registered'].idxmax()]
-        registered_worst_day = weekday_data.loc[weekday_data['registered'].idxmin()]
+            fig11, ax11 = plt.subplots(figsize=(10, 6))
+            sns.barplot(x='weather_condition', y='Rata-rata Pengguna', hue='Tipe Pengguna', 
+                       data=weather_melted, palette='viridis', order=weather_order, ax=ax11)
+            plt.title('Perbandingan Tipe Pengguna Berdasarkan Kondisi Cuaca')
+            plt.xlabel('Kondisi Cuaca')
+            plt.ylabel('Rata-rata Jumlah Pengguna')
+            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            plt.tight_layout()
+            page.pyplot(fig11)
+            plt.close(fig11)
         
-        st.info(f"""
-        **Insight Tipe Pengguna per Hari:**
+            # Insight tentang pengaruh cuaca terhadap tipe pengguna
+            casual_best_weather = weather_analysis.loc[weather_analysis['casual'].idxmax()]
+            casual_worst_weather = weather_analysis.loc[weather_analysis['casual'].idxmin()]
+            registered_best_weather = weather_analysis.loc[weather_analysis['registered'].idxmax()]
+            registered_worst_weather = weather_analysis.loc[weather_analysis['registered'].idxmin()]
         
-        - Pengguna kasual:
-          * Tertinggi pada **{casual_best_day['day_name_id']}** ({casual_best_day['casual']:.2f}/hari)
-          * Terendah pada **{casual_worst_day['day_name_id']}** ({casual_worst_day['casual']:.2f}/hari)
+            casual_impact = ((casual_best_weather['casual'] - casual_worst_weather['casual']) / casual_best_weather['casual']) * 100
+            registered_impact = ((registered_best_weather['registered'] - registered_worst_weather['registered']) / registered_best_weather['registered']) * 100
         
-        - Pengguna terdaftar:
-          * Tertinggi pada **{registered_best_day['day_name_id']}** ({registered_best_day['registered']:.2f}/hari)
-          * Terendah pada **{registered_worst_day['day_name_id']}** ({registered_worst_day['registered']:.2f}/hari)
-        """)
+            page.info(f"""
+            **Insight Pengaruh Cuaca Terhadap Tipe Pengguna:**
+        
+            - Pengguna kasual:
+              * Tertinggi saat **{casual_best_weather['weather_condition']}** ({casual_best_weather['casual']:.2f}/hari)
+              * Terendah saat **{casual_worst_weather['weather_condition']}** ({casual_worst_weather['casual']:.2f}/hari)
+              * Penurunan: {casual_impact:.1f}%
+        
+            - Pengguna terdaftar:
+              * Tertinggi saat **{registered_best_weather['weather_condition']}** ({registered_best_weather['registered']:.2f}/hari)
+              * Terendah saat **{registered_worst_weather['weather_condition']}** ({registered_worst_weather['registered']:.2f}/hari)
+              * Penurunan: {registered_impact:.1f}%
+            """)
+    
+        # Analisis proporsi berdasarkan cuaca
+        weather_ratio = weather_analysis.copy()
+        weather_ratio['casual_pct'] = weather_ratio['casual'] / weather_ratio['cnt'] * 100
+        weather_ratio['registered_pct'] = weather_ratio['registered'] / weather_ratio['cnt'] * 100
+    
+        # Plot pie chart untuk setiap kondisi cuaca
+        page.subheader("Proporsi Pengguna Berdasarkan Kondisi Cuaca")
     
-    # Analisis komposisi pengguna per hari
-    weekday_ratio = weekday_data.copy()
-    weekday_ratio['casual_pct'] = weekday_ratio['casual'] / weekday_ratio['cnt'] * 100
-    weekday_ratio['registered_pct'] = weekday_ratio['registered'] / weekday_ratio['cnt'] * 100
+        # Create grid of pie charts
+        fig12, axes = plt.subplots(1, len(weather_ratio), figsize=(15, 5), squeeze=False)
+    
+        for i, (idx, row) in enumerate(weather_ratio.iterrows()):
+            labels = ['Kasual', 'Terdaftar']
+            sizes = [row['casual_pct'], row['registered_pct']]
+            colors = ['#f0ad4e', '#5cb85c']
+        
+            axes[0][i].pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
+            axes[0][i].set_title(row['weather_condition'])
+            axes[0][i].axis('equal')
     
-    # Plot line chart persentase per hari
-    fig9, ax9 = plt.subplots(figsize=(12, 6))
+        plt.tight_layout()
+        page.pyplot(fig12)
+        plt.close(fig12)
     
-    ax9.plot(weekday_ratio['day_name_id'], weekday_ratio['casual_pct'], marker='o', linewidth=2, label='Pengguna Kasual (%)')
-    ax9.plot(weekday_ratio['day_name_id'], weekday_ratio['registered_pct'], marker='s', linewidth=2, label='Pengguna Terdaftar (%)')
+        # Kesimpulan keseluruhan pengaruh cuaca
+        max_casual_pct_weather = weather_ratio.loc[weather_ratio['casual_pct'].idxmax()]['weather_condition']
     
-    ax9.set_title('Persentase Tipe Pengguna per Hari')
-    ax9.set_xlabel('Hari')
-    ax9.set_ylabel('Persentase (%)')
-    ax9.set_ylim(0, 100)
-    ax9.legend()
-    ax9.grid(True, linestyle='--', alpha=0.7)
+        page.success(f"""
+        **Analisis Pengaruh Cuaca:**
     
+        - Kondisi cuaca memiliki dampak yang signifikan terhadap jumlah penyewaan sepeda
+        - Cuaca cerah konsisten menghasilkan jumlah penyewaan tertinggi, sementara kondisi hujan menurunkan jumlah penyewaan secara drastis
+        - Pengguna kasual lebih sensitif terhadap perubahan kondisi cuaca dibandingkan pengguna terdaftar
+        - Proporsi pengguna kasual tertinggi terjadi pada kondisi **{max_casual_pct_weather}**, menunjukkan bahwa cuaca baik mendorong lebih banyak penggunaan rekreasional
+        - Pengguna terdaftar menunjukkan konsistensi yang lebih tinggi dalam menggunakan layanan pada berbagai kondisi cuaca, mengindikasikan ketergantungan pada sepeda sebagai transportasi utama
+        """)
+
+# Resolusi gambar pada mode perkiraan, lebih rendah dari default st.pyplot (200 dpi) agar cepat
+APPROXIMATE_DPI = 72
+
+# Function untuk menampilkan dan menutup grafik pada mode perkiraan
+def show_approximate_figure(fig):
     plt.tight_layout()
-    st.pyplot(fig9)
+    st.pyplot(fig, dpi=APPROXIMATE_DPI)
+    plt.close(fig)
+
+# Function untuk memberi catatan jika ada kelompok dengan sampel terlalu sedikit
+def warn_small_groups(estimates):
+    if (estimates['n'] < MIN_GROUP_SAMPLE).any():
+        st.caption(f"⚠️ Batang bergaris dan titik berlingkar abu-abu berasal dari kurang dari {MIN_GROUP_SAMPLE} baris sampel, sehingga error bar tidak dapat diestimasi.")
+    elif (estimates['n'] < MIN_STRATUM_SAMPLE).any():
+        st.caption(f"⚠️ Beberapa kelompok memiliki kurang dari {MIN_STRATUM_SAMPLE} baris sampel, error bar kurang andal.")
+
+# Function untuk menggambar grafik batang perkiraan dengan error bar 95%
+def plot_estimate_bars(ax, estimates, x, columns, labels):
+    positions = np.arange(len(estimates))
+    width = 0.8 / len(columns)
     
-    # Kesimpulan keseluruhan pola mingguan
-    st.success("""
-    **Analisis Pola Mingguan:**
+    unreliable = (estimates['n'] < MIN_GROUP_SAMPLE).values
     
-    - Terdapat perbedaan yang jelas antara pola penggunaan pada hari kerja dan akhir pekan
-    - Pengguna kasual menunjukkan peningkatan signifikan pada akhir pekan, mengindikasikan penggunaan untuk aktivitas rekreasi
-    - Pengguna terdaftar memiliki puncak penggunaan pada hari kerja, menunjukkan penggunaan sepeda sebagai transportasi komuter
-    - Persentase pengguna kasual tertinggi terjadi pada akhir pekan, sementara persentase pengguna terdaftar dominan pada hari kerja
-    """)
+    for i, (column, label) in enumerate(zip(columns, labels)):
+        offset = (i - (len(columns) - 1) / 2) * width
+        ax.bar(positions[~unreliable] + offset, estimates[column][~unreliable], width,
+               yerr=estimates[f'{column}_err'][~unreliable], capsize=3, color=f'C{i}', label=label)
+        
+        # Kelompok tanpa error bar digambar bergaris dan pudar
+        ax.bar(positions[unreliable] + offset, estimates[column][unreliable], width,
+               color=f'C{i}', alpha=0.4, hatch='//', edgecolor='grey')
+    
+    ax.set_xticks(positions)
+    ax.set_xticklabels(estimates[x])
+    ax.legend()
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-with tab5:
-    st.header("Pengaruh Cuaca Terhadap Penyewaan Sepeda")
+# Function untuk menampilkan metrik dan kelima tab dari sampel bertingkat. Setiap tab hanya
+# menampilkan grafik utamanya dari rata-rata tertimbang, sehingga jauh lebih cepat dari hasil eksak
+def render_approximate(sample):
+    st.warning(f"⏳ **Hasil perkiraan** dari sampel bertingkat ({len(sample):,} baris). Error bar menunjukkan interval kepercayaan 95%. Hasil akan diperbarui otomatis setelah perhitungan lengkap selesai.")
     
-    # Analisis berdasarkan cuaca
-    weather_analysis = filtered_df.groupby('weather_condition').agg({
-        'cnt': 'mean',
-        'casual': 'mean',
-        'registered': 'mean'
-    }).reset_index()
+    user_columns = ['cnt', 'casual', 'registered']
+    user_labels = ['Total', 'Kasual', 'Terdaftar']
     
-    # Urutkan kondisi cuaca dari yang terbaik ke terburuk
-    weather_order = ['Cerah', 'Berawan/Berkabut', 'Hujan Ringan', 'Hujan Lebat']
-    weather_analysis['weather_order'] = weather_analysis['weather_condition'].apply(lambda x: weather_order.index(x))
-    weather_analysis = weather_analysis.sort_values('weather_order')
+    col1, col2, col3 = st.columns(3)
     
-    col1, col2 = st.columns(2)
+    total_rentals, total_margin = estimate_total(sample, 'cnt')
+    casual_rentals, casual_margin = estimate_total(sample, 'casual')
+    registered_rentals, registered_margin = estimate_total(sample, 'registered')
     
     with col1:
-        # Total penggunaan berdasarkan cuaca
-        fig10, ax10 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='weather_condition', y='cnt', data=weather_analysis, palette='Blues_r', order=weather_order, ax=ax10)
-        plt.title('Rata-rata Penggunaan Sepeda Berdasarkan Kondisi Cuaca')
-        plt.xlabel('Kondisi Cuaca')
-        plt.ylabel('Rata-rata Jumlah Penyewaan')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        st.pyplot(fig10)
+        st.metric("Total Penyewaan", f"≈ {total_rentals:,.0f} ± {total_margin:,.0f}")
+    
+    with col2:
+        st.metric("Pengguna Kasual", f"≈ {casual_rentals:,.0f} ± {casual_margin:,.0f}", 
+                  f"{casual_rentals/total_rentals:.1%} dari total")
+    
+    with col3:
+        st.metric("Pengguna Terdaftar", f"≈ {registered_rentals:,.0f} ± {registered_margin:,.0f}", 
+                  f"{registered_rentals/total_rentals:.1%} dari total")
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Tren Waktu", "Pola Hari Kerja vs Libur", "Analisis Musiman", "Pola Mingguan", "Pengaruh Cuaca"])
+    
+    with tab1:
+        st.header("Tren Penggunaan Sepeda Berdasarkan Waktu")
         
-        # Insight tentang penggunaan berdasarkan cuaca
-        best_weather = weather_analysis.loc[weather_analysis['cnt'].idxmax()]
-        worst_weather = weather_analysis.loc[weather_analysis['cnt'].idxmin()]
+        monthly_trend = estimate_group_means(sample, ['year', 'month'], user_columns)
+        monthly_trend['period'] = monthly_trend['year'].astype(str) + '-' + monthly_trend['month'].astype(str).str.zfill(2)
         
-        weather_impact = ((best_weather['cnt'] - worst_weather['cnt']) / best_weather['cnt']) * 100
+        fig1, ax1 = plt.subplots(figsize=(12, 5))
+        for column, label, marker in zip(user_columns, user_labels, ['o', 's', '^']):
+            ax1.errorbar(monthly_trend['period'], monthly_trend[column], yerr=monthly_trend[f'{column}_err'],
+                         marker=marker, linewidth=2, capsize=3, label=label)
+            
+            # Titik tanpa error bar ditandai lingkaran abu-abu
+            unreliable = monthly_trend['n'] < MIN_GROUP_SAMPLE
+            ax1.scatter(monthly_trend.loc[unreliable, 'period'], monthly_trend.loc[unreliable, column],
+                        s=200, facecolors='none', edgecolors='grey', linewidths=2, zorder=3)
+        ax1.set_title('Tren Rata-rata Penggunaan Sepeda per Bulan (Perkiraan)')
+        ax1.set_xlabel('Periode (Tahun-Bulan)')
+        ax1.set_ylabel('Rata-rata Penggunaan')
+        ax1.tick_params(axis='x', rotation=45)
+        ax1.legend()
+        ax1.grid(True, linestyle='--', alpha=0.7)
+        show_approximate_figure(fig1)
+        warn_small_groups(monthly_trend)
+    
+    with tab2:
+        st.header("Perbandingan Hari Kerja vs Hari Libur")
         
-        st.info(f"""
-        **Insight Pengaruh Cuaca Terhadap Total Penyewaan:**
+        workday_data = estimate_group_means(sample, ['workingday_name'], ['casual', 'registered'])
+        holiday_data = estimate_group_means(sample, ['holiday_name'], ['casual', 'registered'])
         
-        - Kondisi cuaca terbaik untuk penyewaan: **{best_weather['weather_condition']}** ({best_weather['cnt']:.2f} penyewaan/hari)
-        - Kondisi cuaca terburuk untuk penyewaan: **{worst_weather['weather_condition']}** ({worst_weather['cnt']:.2f} penyewaan/hari)
-        - Penurunan: {weather_impact:.1f}% dari kondisi terbaik ke terburuk
-        """)
-    
-    with col2:
-        # Perbandingan tipe pengguna berdasarkan cuaca
-        weather_melted = weather_analysis.melt(id_vars=['weather_condition', 'weather_order'], 
-                                         value_vars=['casual', 'registered'],
-                                         var_name='Tipe Pengguna', value_name='Rata-rata Pengguna')
-        
-        fig11, ax11 = plt.subplots(figsize=(10, 6))
-        sns.barplot(x='weather_condition', y='Rata-rata Pengguna', hue='Tipe Pengguna', 
-                   data=weather_melted, palette='viridis', order=weather_order, ax=ax11)
-        plt.title('Perbandingan Tipe Pengguna Berdasarkan Kondisi Cuaca')
-        plt.xlabel('Kondisi Cuaca')
-        plt.ylabel('Rata-rata Jumlah Pengguna')
-        plt.grid(axis='y', linestyle='--', alpha=0.7)
-        plt.tight_layout()
-        st.pyplot(fig11)
+        fig2, (ax2, ax3) = plt.subplots(1, 2, figsize=(12, 5))
+        plot_estimate_bars(ax2, workday_data, 'workingday_name', ['casual', 'registered'], ['Kasual', 'Terdaftar'])
+        ax2.set_title('Hari Kerja vs Weekend/Libur (Perkiraan)')
+        ax2.set_ylabel('Rata-rata Jumlah Pengguna')
+        plot_estimate_bars(ax3, holiday_data, 'holiday_name', ['casual', 'registered'], ['Kasual', 'Terdaftar'])
+        ax3.set_title('Hari Kerja vs Hari Libur Nasional (Perkiraan)')
+        show_approximate_figure(fig2)
+        warn_small_groups(pd.concat([workday_data, holiday_data]))
+    
+    with tab3:
+        st.header("Pengaruh Musim Terhadap Penggunaan Sepeda")
         
-        # Insight tentang pengaruh cuaca terhadap tipe pengguna
-        casual_best_weather = weather_analysis.loc[weather_analysis['casual'].idxmax()]
-        casual_worst_weather = weather_analysis.loc[weather_analysis['casual'].idxmin()]
-        registered_best_weather = weather_analysis.loc[weather_analysis['registered'].idxmax()]
-        registered_worst_weather = weather_analysis.loc[weather_analysis['registered'].idxmin()]
+        # Kelompokkan juga berdasarkan kode musim agar urutannya kronologis
+        season_data = estimate_group_means(sample, ['season', 'season_name'], user_columns)
         
-        casual_impact = ((casual_best_weather['casual'] - casual_worst_weather['casual']) / casual_best_weather['casual']) * 100
-        registered_impact = ((registered_best_weather['registered'] - registered_worst_weather['registered']) / registered_best_weather['registered']) * 100
+        fig4, ax4 = plt.subplots(figsize=(12, 5))
+        plot_estimate_bars(ax4, season_data, 'season_name', user_columns, user_labels)
+        ax4.set_title('Rata-rata Penggunaan Sepeda Berdasarkan Musim (Perkiraan)')
+        ax4.set_ylabel('Rata-rata Jumlah Penyewaan per Hari')
+        show_approximate_figure(fig4)
+        warn_small_groups(season_data)
+    
+    with tab4:
+        st.header("Pola Penggunaan Mingguan")
         
-        st.info(f"""
-        **Insight Pengaruh Cuaca Terhadap Tipe Pengguna:**
+        day_name_id = {
+            'Monday': 'Senin', 'Tuesday': 'Selasa', 'Wednesday': 'Rabu', 
+            'Thursday': 'Kamis', 'Friday': 'Jumat', 'Saturday': 'Sabtu', 'Sunday': 'Minggu'
+        }
+        weekday_data = estimate_group_means(sample, ['day_of_week', 'day_name'], user_columns)
+        weekday_data['day_name_id'] = weekday_data['day_name'].map(day_name_id)
         
-        - Pengguna kasual:
-          * Tertinggi saat **{casual_best_weather['weather_condition']}** ({casual_best_weather['casual']:.2f}/hari)
-          * Terendah saat **{casual_worst_weather['weather_condition']}** ({casual_worst_weather['casual']:.2f}/hari)
-          * Penurunan: {casual_impact:.1f}%
+        fig7, ax7 = plt.subplots(figsize=(12, 5))
+        plot_estimate_bars(ax7, weekday_data, 'day_name_id', user_columns, user_labels)
+        ax7.set_title('Pola Penggunaan Sepeda Sepanjang Minggu (Perkiraan)')
+        ax7.set_ylabel('Rata-rata Jumlah Penyewaan')
+        show_approximate_figure(fig7)
+        warn_small_groups(weekday_data)
+    
+    with tab5:
+        st.header("Pengaruh Cuaca Terhadap Penyewaan Sepeda")
         
-        - Pengguna terdaftar:
-          * Tertinggi saat **{registered_best_weather['weather_condition']}** ({registered_best_weather['registered']:.2f}/hari)
-          * Terendah saat **{registered_worst_weather['weather_condition']}** ({registered_worst_weather['registered']:.2f}/hari)
-          * Penurunan: {registered_impact:.1f}%
-        """)
-    
-    # Analisis proporsi berdasarkan cuaca
-    weather_ratio = weather_analysis.copy()
-    weather_ratio['casual_pct'] = weather_ratio['casual'] / weather_ratio['cnt'] * 100
-    weather_ratio['registered_pct'] = weather_ratio['registered'] / weather_ratio['cnt'] * 100
-    
-    # Plot pie chart untuk setiap kondisi cuaca
-    st.subheader("Proporsi Pengguna Berdasarkan Kondisi Cuaca")
-    
-    # Create grid of pie charts
-    fig12, axes = plt.subplots(1, len(weather_ratio), figsize=(15, 5))
-    
-    for i, (idx, row) in enumerate(weather_ratio.iterrows()):
-        labels = ['Kasual', 'Terdaftar']
-        sizes = [row['casual_pct'], row['registered_pct']]
-        colors = ['#f0ad4e', '#5cb85c']
+        # Kelompokkan juga berdasarkan kode cuaca agar urut dari yang terbaik ke terburuk
+        weather_analysis = estimate_group_means(sample, ['weathersit', 'weather_condition'], user_columns)
         
-        axes[i].pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-        axes[i].set_title(row['weather_condition'])
-        axes[i].axis('equal')
-    
-    plt.tight_layout()
-    st.pyplot(fig12)
-    
-    # Kesimpulan keseluruhan pengaruh cuaca
-    max_casual_pct_weather = weather_ratio.loc[weather_ratio['casual_pct'].idxmax()]['weather_condition']
-    
-    st.success(f"""
-    **Analisis Pengaruh Cuaca:**
-    
-    - Kondisi cuaca memiliki dampak yang signifikan terhadap jumlah penyewaan sepeda
-    - Cuaca cerah konsisten menghasilkan jumlah penyewaan tertinggi, sementara kondisi hujan menurunkan jumlah penyewaan secara drastis
-    - Pengguna kasual lebih sensitif terhadap perubahan kondisi cuaca dibandingkan pengguna terdaftar
-    - Proporsi pengguna kasual tertinggi terjadi pada kondisi **{max_casual_pct_weather}**, menunjukkan bahwa cuaca baik mendorong lebih banyak penggunaan rekreasional
-    - Pengguna terdaftar menunjukkan konsistensi yang lebih tinggi dalam menggunakan layanan pada berbagai kondisi cuaca, mengindikasikan ketergantungan pada sepeda sebagai transportasi utama
-    """)
+        fig10, ax10 = plt.subplots(figsize=(12, 5))
+        plot_estimate_bars(ax10, weather_analysis, 'weather_condition', user_columns, user_labels)
+        ax10.set_title('Rata-rata Penggunaan Sepeda Berdasarkan Kondisi Cuaca (Perkiraan)')
+        ax10.set_ylabel('Rata-rata Jumlah Penyewaan')
+        show_approximate_figure(fig10)
+        warn_small_groups(weather_analysis)
+
+# Tampilkan metrik dan tab analisis. Pada mode progresif, hasil perkiraan dari sampel
+# bertingkat ditampilkan lebih dulu. Hasil eksak (termasuk semua grafik) direkam dulu,
+# lalu menggantikan hasil perkiraan sekaligus setelah perhitungan lengkap selesai
+analysis_area = st.empty()
+
+if progressive_mode:
+    with analysis_area.container():
+        render_approximate(apply_filters(stratified_sample(sample_ratio)))
+    
+    exact_page = DeferredPage()
+    render_analysis(filtered_df, exact_page)
+    with analysis_area.container():
+        exact_page.show()
+else:
+    with analysis_area.container():
+        render_analysis(filtered_df)
 
 # Kesimpulan dan Rekomendasi
 st.header("Kesimpulan dan Rekomendasi")
@@ -0,0 +1,398 @@
+"""Load test untuk dashboard.py dengan banyak sesi headless secara bersamaan.
+
+Script ini menjalankan satu proses `streamlit run dashboard.py` (atau memakai
+server yang sudah berjalan lewat --url), lalu membuka banyak sesi websocket
+seperti browser. Setiap sesi memutar ulang jejak interaksi acak: mengubah
+filter tahun/musim/tipe hari, berpindah tab, dan membuka expander data detail.
+
+Perpindahan tab dan membuka expander hanya terjadi di browser (tidak memicu
+rerun di server), sehingga langkah tersebut hanya dihitung sebagai jeda
+berpikir pengguna. Latensi diukur dari rerun dikirim sampai server mengirim
+pesan script_finished, untuk setiap perubahan filter dan saat halaman pertama
+kali dimuat, tetapi hanya rerun dari jejak interaksi yang masuk ke p50/p95/p99;
+rerun persiapan (halaman pertama dan pengaktifan mode progresif) dicatat di
+kolom tersendiri. Seperti browser, setiap sesi juga mengunduh gambar grafik
+dari /media/... Server mengirim pesan besar yang sudah pernah diterima sesi
+sebagai ref_hash; seperti browser, sesi menjawabnya dari cache pesannya
+sendiri dan hanya mengunduh dari /_stcore/message jika pesan tidak ada di
+cache. Unduhan ini menambah beban server tetapi tidak dihitung dalam latensi
+rerun.
+
+Rerun yang melewati --timeout dan koneksi yang terputus dicatat di kolom
+timeouts dan disconnects; sesi tersebut berhenti, sesi lain tetap berjalan.
+
+Sebelum tingkat pertama, satu sesi pemanasan dijalankan agar impor, cache
+load_data, dan matplotlib tidak terhitung. Memori per sesi adalah kenaikan
+puncak RSS server selama satu tingkat dibagi jumlah sesi, diukur dari RSS
+setelah sesi tingkat sebelumnya ditutup. Angka ini adalah puncak, bukan
+pemakaian memori dalam kondisi stabil.
+
+Contoh:
+    python load_test.py --concurrency 1 2 4 8 --steps 10
+    python load_test.py --concurrency 4 --progressive --sample-ratio 5
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+import pandas as pd
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.httpclient import AsyncHTTPClient
+from tornado.websocket import WebSocketClosedError, websocket_connect
+
+APP_FILE = "dashboard.py"
+
+# Label multiselect di sidebar yang diubah oleh jejak interaksi
+FILTER_LABELS = ["Pilih Tahun", "Pilih Musim", "Pilih Tipe Hari"]
+
+# Label widget mode progresif
+PROGRESSIVE_LABEL = "Tampilkan hasil perkiraan lebih dulu"
+SAMPLE_RATIO_LABEL = "Rasio Sampel (%)"
+
+# Bobot aksi pada jejak interaksi: perubahan filter lebih sering daripada aksi lain
+ACTIONS = ["filter", "tab", "expander"]
+ACTION_WEIGHTS = [0.6, 0.3, 0.1]
+
+WIDGET_TYPES = ["multiselect", "checkbox", "slider"]
+
+# Jeda (detik) setelah sesi ditutup agar server sempat membersihkan sesi sebelum RSS diukur
+SETTLE_TIME = 2.0
+
+
+# Function untuk mencari port TCP yang sedang tidak dipakai
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+# Function untuk menjalankan server Streamlit dan menunggu sampai siap
+def start_server(port, startup_timeout=60):
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_FILE,
+         "--server.headless", "true",
+         "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://localhost:{port}/_stcore/health") as response:
+                if response.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.5)
+
+    server.terminate()
+    raise RuntimeError(f"Server Streamlit tidak siap dalam {startup_timeout} detik")
+
+
+# Function untuk membaca RSS proses server (MB), NaN jika tidak tersedia
+def server_rss_mb(pid):
+    if pid is None:
+        return float("nan")
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+class Session:
+    """Satu sesi browser headless yang terhubung ke server lewat websocket."""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.http_client = AsyncHTTPClient()
+        self.connection = None
+        self.widgets = {}
+        self.widget_states = {}
+        self.media_downloads = []
+        self.message_cache = {}
+        self.latencies = []
+        self.setup_latencies = []
+        self.errors = []
+        self.timeouts = 0
+        self.disconnects = 0
+        self.media_requests = 0
+
+    async def connect(self):
+        stream_url = self.base_url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.connection = await websocket_connect(stream_url)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+    async def rerun(self, setup=False):
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        msg.rerun_script.page_script_hash = ""
+        msg.rerun_script.widget_states.widgets.extend(self.widget_states.values())
+
+        start = time.perf_counter()
+        await self.connection.write_message(msg.SerializeToString(), binary=True)
+        await asyncio.wait_for(self._read_until_finished(), self.timeout)
+        (self.setup_latencies if setup else self.latencies).append(time.perf_counter() - start)
+
+        # Tunggu unduhan gambar selesai sebelum aksi berikutnya, seperti halaman yang selesai dimuat
+        await asyncio.gather(*self.media_downloads)
+        self.media_downloads = []
+
+    async def _read_until_finished(self):
+        while True:
+            payload = await self.connection.read_message()
+            if payload is None:
+                raise ConnectionError("Koneksi websocket ditutup oleh server")
+
+            msg = ForwardMsg()
+            msg.ParseFromString(payload)
+            msg_type = msg.WhichOneof("type")
+
+            # Pesan besar yang sudah pernah diterima sesi ini dikirim hanya sebagai hash
+            if msg_type == "ref_hash":
+                msg = await self._resolve_reference(msg.ref_hash)
+                if msg is None:
+                    continue
+                msg_type = msg.WhichOneof("type")
+            elif msg.metadata.cacheable:
+                self.message_cache[msg.hash] = msg
+
+            if msg_type == "script_finished":
+                return
+            if msg_type == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                self._handle_element(msg.delta.new_element)
+
+    async def _resolve_reference(self, ref_hash):
+        # Seperti browser, jawab dari cache pesan sesi; unduh hanya jika belum pernah diterima
+        if ref_hash not in self.message_cache:
+            response = await self._fetch(f"/_stcore/message?hash={ref_hash}")
+            if response is None:
+                return None
+            msg = ForwardMsg()
+            msg.ParseFromString(response.body)
+            self.message_cache[ref_hash] = msg
+        return self.message_cache[ref_hash]
+
+    def _handle_element(self, element):
+        element_type = element.WhichOneof("type")
+        if element_type == "exception":
+            self.errors.append(element.exception.message)
+        elif element_type == "imgs":
+            # Hanya gambar dari server ini; gambar dari URL eksternal tidak membebani server
+            for image in element.imgs.imgs:
+                if image.url.startswith("/"):
+                    self.media_downloads.append(asyncio.create_task(self._fetch(image.url)))
+        elif element_type in WIDGET_TYPES:
+            widget = getattr(element, element_type)
+            self.widgets[widget.label] = widget
+
+    async def _fetch(self, path):
+        self.media_requests += 1
+        try:
+            return await self.http_client.fetch(self.base_url + path, request_timeout=self.timeout)
+        except Exception as e:
+            self.errors.append(f"{path}: {e}")
+            return None
+
+    def set_multiselect(self, label, indices):
+        state = WidgetState(id=self.widgets[label].id)
+        state.int_array_value.data.extend(indices)
+        self.widget_states[label] = state
+
+    def set_checkbox(self, label, value):
+        self.widget_states[label] = WidgetState(id=self.widgets[label].id, bool_value=value)
+
+    def set_slider(self, label, value):
+        state = WidgetState(id=self.widgets[label].id)
+        state.double_array_value.data.append(value)
+        self.widget_states[label] = state
+
+    def selected_indices(self, label):
+        state = self.widget_states.get(label)
+        if state is None:
+            return list(self.widgets[label].default)
+        return list(state.int_array_value.data)
+
+
+# Function untuk menjalankan satu sesi yang memutar ulang jejak interaksi
+async def run_session(session_id, base_url, args):
+    rng = random.Random(args.seed + session_id)
+    session = Session(base_url, args.timeout)
+
+    try:
+        await session.connect()
+        await session.rerun(setup=True)
+
+        if args.progressive:
+            session.set_checkbox(PROGRESSIVE_LABEL, True)
+            await session.rerun(setup=True)
+            session.set_slider(SAMPLE_RATIO_LABEL, args.sample_ratio)
+            await session.rerun(setup=True)
+
+        # Hanya perubahan filter yang dihitung sebagai langkah, karena hanya itu yang memicu rerun
+        filter_changes = 0
+        while filter_changes < args.steps:
+            action = rng.choices(ACTIONS, weights=ACTION_WEIGHTS)[0]
+
+            if action == "filter":
+                label = rng.choice(FILTER_LABELS)
+                selected = session.selected_indices(label)
+                option = rng.randrange(len(session.widgets[label].options))
+
+                # Hapus opsi jika masih ada opsi lain yang terpilih, selain itu tambahkan
+                if option in selected and len(selected) > 1:
+                    selected.remove(option)
+                elif option not in selected:
+                    selected.append(option)
+                session.set_multiselect(label, sorted(selected))
+                await session.rerun()
+                filter_changes += 1
+
+            # Aksi "tab" dan "expander" tidak memicu rerun, hanya jeda berpikir
+            if args.think_time:
+                await asyncio.sleep(rng.uniform(0, args.think_time))
+    except asyncio.TimeoutError:
+        # Pesan dari rerun yang terlambat masih bisa datang, jadi sesi dihentikan
+        session.timeouts += 1
+    except (ConnectionError, WebSocketClosedError, OSError):
+        session.disconnects += 1
+    finally:
+        session.close()
+
+    return session
+
+
+# Function untuk memantau puncak RSS server selama satu tingkat konkurensi
+async def sample_peak_rss(pid, peak, interval=0.05):
+    while True:
+        peak[0] = max(peak[0], server_rss_mb(pid))
+        await asyncio.sleep(interval)
+
+
+# Function untuk menghitung persentil latensi (ms), NaN jika tidak ada rerun yang selesai
+def latency_percentile(latencies, q):
+    if len(latencies) == 0:
+        return float("nan")
+    return np.percentile(latencies, q)
+
+
+# Function untuk menjalankan satu tingkat konkurensi dan merangkum hasilnya
+async def run_level(concurrency, base_url, pid, args):
+    # Baseline diukur setelah sesi tingkat sebelumnya (atau sesi pemanasan) ditutup
+    await asyncio.sleep(SETTLE_TIME)
+    baseline_mb = server_rss_mb(pid)
+    peak = [baseline_mb]
+    sampler = asyncio.create_task(sample_peak_rss(pid, peak))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_session(session_id, base_url, args) for session_id in range(concurrency)),
+                                   return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    sampler.cancel()
+
+    # Exception yang tidak terduga dihitung sebagai error tanpa menggagalkan sesi lain
+    sessions = [result for result in results if isinstance(result, Session)]
+    unexpected = len(results) - len(sessions)
+
+    latencies = np.array([latency for session in sessions for latency in session.latencies]) * 1000
+    setup_reruns = sum(len(session.setup_latencies) for session in sessions)
+
+    return {
+        'concurrency': concurrency,
+        'reruns': len(latencies),
+        'setup reruns': setup_reruns,
+        'errors': sum(len(session.errors) for session in sessions) + unexpected,
+        'timeouts': sum(session.timeouts for session in sessions),
+        'disconnects': sum(session.disconnects for session in sessions),
+        'media (req)': sum(session.media_requests for session in sessions),
+        'throughput (rerun/s)': (len(latencies) + setup_reruns) / elapsed,
+        'p50 (ms)': latency_percentile(latencies, 50),
+        'p95 (ms)': latency_percentile(latencies, 95),
+        'p99 (ms)': latency_percentile(latencies, 99),
+        'puncak memori/sesi (MB)': (peak[0] - baseline_mb) / concurrency,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test sesi bersamaan untuk dashboard.py")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="Jumlah sesi bersamaan yang diuji, satu tingkat per nilai")
+    parser.add_argument("--steps", type=int, default=10,
+                        help="Jumlah perubahan filter (rerun) pada jejak interaksi setiap sesi; "
+                             "pindah tab dan buka expander diselipkan di antaranya tanpa dihitung")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Jeda acak maksimum (detik) antar aksi")
+    parser.add_argument("--timeout", type=float, default=120.0,
+                        help="Batas waktu (detik) untuk satu rerun")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Seed untuk jejak interaksi acak")
+    parser.add_argument("--progressive", action="store_true",
+                        help="Aktifkan mode progresif di setiap sesi")
+    parser.add_argument("--sample-ratio", type=int, default=10,
+                        help="Rasio sampel (%%) untuk mode progresif, 1-50 sesuai rentang slider di sidebar")
+    parser.add_argument("--url",
+                        help="Alamat server yang sudah berjalan, misalnya http://localhost:8501 "
+                             "(memori per sesi tidak diukur)")
+    parser.add_argument("--csv", help="Simpan hasil ke file CSV")
+    args = parser.parse_args(argv)
+    if not 1 <= args.sample_ratio <= 50:
+        parser.error("--sample-ratio harus antara 1 dan 50")
+    return args
+
+
+async def run_levels(base_url, pid, args):
+    # Sesi pemanasan agar biaya awal aplikasi tidak terhitung di tingkat pertama
+    print("Menjalankan sesi pemanasan...", flush=True)
+    await run_session(-1, base_url, args)
+
+    rows = []
+    for concurrency in args.concurrency:
+        print(f"Menjalankan {concurrency} sesi bersamaan...", flush=True)
+        rows.append(await run_level(concurrency, base_url, pid, args))
+    return rows
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    server = None
+    if args.url:
+        base_url = args.url.rstrip("/")
+    else:
+        port = free_port()
+        server = start_server(port)
+        base_url = f"http://localhost:{port}"
+
+    try:
+        rows = asyncio.run(run_levels(base_url, server.pid if server else None, args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    results = pd.DataFrame(rows)
+    print(results.to_string(index=False, float_format=lambda value: f"{value:.1f}"))
+
+    if args.csv:
+        results.to_csv(args.csv, index=False)
+
+
+if __name__ == "__main__":
+    main()